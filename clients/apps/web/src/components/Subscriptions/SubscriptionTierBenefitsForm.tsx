@@ -354,7 +354,10 @@ export const UpdateSubscriptionTierBenefitModalContent = ({
         setIsLoading(true)
         await updateSubscriptionBenefit.mutateAsync({
           id: benefit.id,
-          subscriptionBenefitUpdate,
+          subscriptionBenefitUpdate: {
+            ...subscriptionBenefitUpdate,
+            type: benefit.type,
+          } as SubscriptionBenefitUpdate,
         })
 
         hideModal()
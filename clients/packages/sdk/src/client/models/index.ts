@@ -4323,7 +4323,23 @@ export interface SubscriptionBenefitArticlesUpdate {
      * @memberof SubscriptionBenefitArticlesUpdate
      */
     description?: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof SubscriptionBenefitArticlesUpdate
+     */
+    type: SubscriptionBenefitArticlesUpdateTypeEnum;
 }
+
+
+/**
+ * @export
+ */
+export const SubscriptionBenefitArticlesUpdateTypeEnum = {
+    ARTICLES: 'articles'
+} as const;
+export type SubscriptionBenefitArticlesUpdateTypeEnum = typeof SubscriptionBenefitArticlesUpdateTypeEnum[keyof typeof SubscriptionBenefitArticlesUpdateTypeEnum];
+
 /**
  * @type SubscriptionBenefitCreate
  * @export
@@ -4531,6 +4547,12 @@ export interface SubscriptionBenefitCustomUpdate {
      * @memberof SubscriptionBenefitCustomUpdate
      */
     description?: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof SubscriptionBenefitCustomUpdate
+     */
+    type: SubscriptionBenefitCustomUpdateTypeEnum;
     /**
      * 
      * @type {object}
@@ -4539,6 +4561,16 @@ export interface SubscriptionBenefitCustomUpdate {
     properties?: object;
 }
 
+
+/**
+ * @export
+ */
+export const SubscriptionBenefitCustomUpdateTypeEnum = {
+    CUSTOM: 'custom'
+} as const;
+export type SubscriptionBenefitCustomUpdateTypeEnum = typeof SubscriptionBenefitCustomUpdateTypeEnum[keyof typeof SubscriptionBenefitCustomUpdateTypeEnum];
+
+
 /**
  * An enumeration.
  * @export
@@ -1,6 +1,16 @@
 import math
 from collections.abc import Sequence
-from typing import Annotated, Any, Generic, NamedTuple, Self, TypeVar, overload
+from typing import (
+    Annotated,
+    Any,
+    Generic,
+    NamedTuple,
+    Self,
+    TypeVar,
+    get_args,
+    get_origin,
+    overload,
+)
 
 from fastapi import Depends, Query
 from pydantic.generics import GenericModel
@@ -99,6 +109,16 @@ class ListResource(GenericModel, Generic[T]):
     items: Sequence[T] = []
     pagination: Pagination
 
+    @classmethod
+    def __concrete_name__(cls, params: tuple[type[Any], ...]) -> str:
+        # Name `Annotated` parameters, like discriminated unions, after the
+        # type they wrap, so the schema name doesn't embed the `FieldInfo`
+        params = tuple(
+            get_args(param)[0] if get_origin(param) is Annotated else param
+            for param in params
+        )
+        return super().__concrete_name__(params)
+
     @classmethod
     def from_paginated_results(
         cls, items: Sequence[T], total_count: int, pagination_params: PaginationParams
@@ -2,9 +2,24 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import TIMESTAMP, Boolean, Column, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    TIMESTAMP,
+    Boolean,
+    Column,
+    ForeignKey,
+    Integer,
+    String,
+    exists,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
+from sqlalchemy.orm import (
+    Mapped,
+    column_property,
+    declared_attr,
+    mapped_column,
+    relationship,
+)
 from sqlalchemy.schema import Index, UniqueConstraint
 
 from polar.enums import Platforms
@@ -78,6 +93,18 @@ class User(RecordModel):
     def oauth_accounts(cls) -> Mapped[list[OAuthAccount]]:
         return relationship(OAuthAccount, lazy="raise", back_populates="user")
 
+    @declared_attr
+    def has_github_account(cls) -> Mapped[bool]:
+        # Deferred: explicitly `undefer` it in queries that need it
+        return column_property(
+            exists().where(
+                OAuthAccount.user_id == cls.id,
+                OAuthAccount.platform == Platforms.github,
+            ),
+            deferred=True,
+            raiseload=True,
+        )
+
     invite_only_approved: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False
     )
@@ -34,6 +34,7 @@ from .schemas import (
     SubscribeSessionCreate,
     SubscriptionBenefitCreate,
     SubscriptionBenefitUpdate,
+    SubscriptionSchemaCache,
     SubscriptionsImported,
     SubscriptionsStatistics,
     SubscriptionSummary,
@@ -41,7 +42,7 @@ from .schemas import (
     SubscriptionTierCreate,
     SubscriptionTierUpdate,
     SubscriptionUpgrade,
-    subscription_benefit_schema_map,
+    subscription_benefit_from_orm,
 )
 from .schemas import (
     Subscription as SubscriptionSchema,
@@ -122,7 +123,7 @@ async def search_subscription_tiers(
     )
 
     return ListResource.from_paginated_results(
-        [SubscriptionTierSchema.from_orm(result) for result in results],
+        [SubscriptionTierSchema.from_db(result) for result in results],
         count,
         pagination,
     )
@@ -269,10 +270,7 @@ async def search_subscription_benefits(
     )
 
     return ListResource.from_paginated_results(
-        [
-            subscription_benefit_schema_map[result.type].from_orm(result)
-            for result in results
-        ],
+        [subscription_benefit_from_orm(result) for result in results],
         count,
         pagination,
     )
@@ -511,9 +509,12 @@ async def search_subscriptions(
         sorting=sorting,
     )
 
+    cache = SubscriptionSchemaCache()
     return ListResource.from_paginated_results(
         [
-            SubscriptionSchema.from_db(result, include_user_email=can_see_emails)
+            SubscriptionSchema.from_db(
+                result, include_user_email=can_see_emails, cache=cache
+            )
             for result in results
         ],
         count,
@@ -539,7 +540,7 @@ async def create_free_subscription(
         auth_method=auth.auth_method,
     )
 
-    # get for return with loaded relations (User.oauth_accounts)
+    # get for return with loaded relations (User.has_github_account)
     ret_sub = await subscription_service.get(session, sub.id)
     if not ret_sub:
         raise ResourceNotFound()
@@ -710,7 +711,7 @@ async def upgrade_subscription(
         user=auth.subject,
     )
 
-    # get for return with loaded relations (User.oauth_accounts)
+    # get for return with loaded relations (User.has_github_account)
     ret_sub = await subscription_service.get(session, sub.id)
     if not ret_sub:
         raise ResourceNotFound()
@@ -735,7 +736,7 @@ async def cancel_subscription(
         session, subscription=subscription, authz=authz, user=auth.subject
     )
 
-    # get for return with loaded relations (User.oauth_accounts)
+    # get for return with loaded relations (User.has_github_account)
     ret_sub = await subscription_service.get(session, sub.id)
     if not ret_sub:
         raise ResourceNotFound()
@@ -780,9 +781,12 @@ async def search_subscriptions_summary(
 
     can_see_emails = await authz.can(auth.subject, AccessType.write, organization)
 
+    cache = SubscriptionSchemaCache()
     return ListResource.from_paginated_results(
         [
-            SubscriptionSummary.from_db(result, include_user_email=can_see_emails)
+            SubscriptionSummary.from_db(
+                result, include_user_email=can_see_emails, cache=cache
+            )
             for result in results
         ],
         count,
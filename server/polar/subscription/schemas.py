@@ -1,15 +1,20 @@
 import uuid
 from collections.abc import Iterable
 from datetime import date, datetime
-from typing import Any, Literal, Self
+from typing import Annotated, Any, Literal, Self, TypeVar, get_args
 
 import stripe as stripe_lib
+from fastapi import Body
 from pydantic import UUID4, AnyHttpUrl, EmailStr, Field, root_validator, validator
 
 from polar.enums import Platforms
 from polar.kit.schemas import Schema, TimestampedSchema
+from polar.models.organization import Organization as OrganizationModel
 from polar.models.subscription import Subscription as SubscriptionModel
 from polar.models.subscription import SubscriptionStatus
+from polar.models.subscription_benefit import (
+    SubscriptionBenefit as SubscriptionBenefitModel,
+)
 from polar.models.subscription_benefit import (
     SubscriptionBenefitArticlesProperties,
     SubscriptionBenefitCustomProperties,
@@ -27,6 +32,21 @@ BENEFIT_DESCRIPTION_MIN_LENGTH = 3
 BENEFIT_DESCRIPTION_MAX_LENGTH = 42
 
 
+SchemaType = TypeVar("SchemaType", bound=Schema)
+
+
+def _construct_from_db(
+    schema: type[SchemaType], db_object: Any, **overrides: Any
+) -> SchemaType:
+    # Data coming from the database is trusted: skip validation
+    values = {
+        name: getattr(db_object, name)
+        for name in schema.__fields__
+        if name not in overrides
+    }
+    return schema.construct(**values, **overrides)
+
+
 # SubscriptionBenefitCreate
 
 
@@ -40,12 +60,12 @@ class SubscriptionBenefitCreateBase(Schema):
     repository_id: UUID4 | None = None
     properties: SubscriptionBenefitProperties
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def check_either_organization_or_repository(
         cls, values: dict[str, Any]
     ) -> dict[str, Any]:
-        organization_id = values.get("organization_id")
-        repository_id = values.get("repository_id")
+        organization_id = values["organization_id"]
+        repository_id = values["repository_id"]
         if organization_id is not None and repository_id is not None:
             raise ValueError(
                 "Subscription benefits should either be linked to "
@@ -88,18 +108,22 @@ class SubscriptionBenefitUpdateBase(Schema):
 
 
 class SubscriptionBenefitArticlesUpdate(SubscriptionBenefitUpdateBase):
+    type: Literal[SubscriptionBenefitType.articles]
     # Don't allow to update properties, as both Free and Premium posts
     # are pre-created by us and shouldn't change
     ...
 
 
 class SubscriptionBenefitCustomUpdate(SubscriptionBenefitUpdateBase):
+    type: Literal[SubscriptionBenefitType.custom]
     properties: SubscriptionBenefitCustomProperties | None = None
 
 
-SubscriptionBenefitUpdate = (
-    SubscriptionBenefitArticlesUpdate | SubscriptionBenefitCustomUpdate
-)
+SubscriptionBenefitUpdate = Annotated[
+    SubscriptionBenefitArticlesUpdate | SubscriptionBenefitCustomUpdate,
+    # `Body` so FastAPI accepts the discriminated union as a request body
+    Body(discriminator="type"),
+]
 
 
 # SubscriptionBenefit
@@ -126,16 +150,28 @@ class SubscriptionBenefitCustom(SubscriptionBenefitBase):
     is_tax_applicable: bool
 
 
-SubscriptionBenefit = SubscriptionBenefitArticles | SubscriptionBenefitCustom
+SubscriptionBenefit = Annotated[
+    SubscriptionBenefitArticles | SubscriptionBenefitCustom,
+    Field(discriminator="type"),
+]
 
-subscription_benefit_schema_map: dict[
-    SubscriptionBenefitType, type[SubscriptionBenefit]
+# Tag to schema lookup, built from the tagged union so both stay in sync
+_subscription_benefit_schemas: dict[
+    SubscriptionBenefitType,
+    type[SubscriptionBenefitArticles] | type[SubscriptionBenefitCustom],
 ] = {
-    SubscriptionBenefitType.articles: SubscriptionBenefitArticles,
-    SubscriptionBenefitType.custom: SubscriptionBenefitCustom,
+    get_args(schema.__fields__["type"].outer_type_)[0]: schema
+    for schema in get_args(get_args(SubscriptionBenefit)[0])
 }
 
 
+def subscription_benefit_from_orm(
+    subscription_benefit: SubscriptionBenefitModel,
+) -> SubscriptionBenefitArticles | SubscriptionBenefitCustom:
+    schema = _subscription_benefit_schemas[subscription_benefit.type]
+    return schema.from_orm(subscription_benefit)
+
+
 # SubscriptionTier
 
 
@@ -153,16 +189,16 @@ class SubscriptionTierCreate(Schema):
     )
     is_highlighted: bool = False
     price_amount: int = Field(..., gt=0)
-    price_currency: str = Field("USD", regex="USD")
+    price_currency: Literal["USD"] = "USD"
     organization_id: UUID4 | None = None
     repository_id: UUID4 | None = None
 
-    @root_validator
+    @root_validator(skip_on_failure=True)
     def check_either_organization_or_repository(
         cls, values: dict[str, Any]
     ) -> dict[str, Any]:
-        organization_id = values.get("organization_id")
-        repository_id = values.get("repository_id")
+        organization_id = values["organization_id"]
+        repository_id = values["repository_id"]
         if organization_id is not None and repository_id is not None:
             raise ValueError(
                 "Subscription tiers should either be linked to "
@@ -185,7 +221,7 @@ class SubscriptionTierUpdate(Schema):
     )
     is_highlighted: bool | None = None
     price_amount: int | None = Field(default=None, gt=0)
-    price_currency: str | None = Field(default=None, regex="USD")
+    price_currency: Literal["USD"] | None = None
 
 
 class SubscriptionTierBenefitsUpdate(Schema):
@@ -193,7 +229,9 @@ class SubscriptionTierBenefitsUpdate(Schema):
 
 
 class SubscriptionTierBenefit(SubscriptionBenefitBase):
-    ...
+    @classmethod
+    def from_db(cls, subscription_benefit: SubscriptionBenefitModel) -> Self:
+        return _construct_from_db(cls, subscription_benefit)
 
 
 class SubscriptionTier(TimestampedSchema):
@@ -214,8 +252,21 @@ class SubscriptionTier(TimestampedSchema):
         cls, v: Iterable[SubscriptionTierBenefit]
     ) -> list[SubscriptionTierBenefit]:
         # FIXME: Not needed in Pydantic V2
+        if isinstance(v, list):
+            return v
         return list(v)
 
+    @classmethod
+    def from_db(cls, subscription_tier: SubscriptionTierModel) -> Self:
+        return _construct_from_db(
+            cls,
+            subscription_tier,
+            benefits=[
+                SubscriptionTierBenefit.from_db(benefit)
+                for benefit in subscription_tier.benefits
+            ],
+        )
+
 
 # SubscribeSession
 
@@ -275,12 +326,13 @@ class SubscribeSession(Schema):
         subscription_tier: SubscriptionTierModel,
     ) -> Self:
         organization_subscriber_id: uuid.UUID | None = None
-        if checkout_session.metadata:
+        raw_organization_subscriber_id = (checkout_session.metadata or {}).get(
+            "organization_subscriber_id"
+        )
+        if raw_organization_subscriber_id:
             try:
-                organization_subscriber_id = uuid.UUID(
-                    checkout_session.metadata["organization_subscriber_id"]
-                )
-            except (KeyError, ValueError):
+                organization_subscriber_id = uuid.UUID(raw_organization_subscriber_id)
+            except ValueError:
                 pass
 
         return cls(
@@ -318,16 +370,15 @@ class SubscriptionUser(Schema):
     @classmethod
     def from_db(cls, user: User, include_user_email: bool) -> Self:
         # show usernames if the user has a connected github account
-        gh = user.get_platform_oauth_account(Platforms.github)
-        if gh:
-            return cls(
+        if user.has_github_account:
+            return cls.construct(
                 name=user.username,
                 github_username=user.username,
                 avatar_url=user.avatar_url,
                 email=user.email if include_user_email else None,
             )
 
-        return cls(
+        return cls.construct(
             # The username is an email address. Do not show it. Use the first character as a workaround.
             name=user.username[0],
             avatar_url=user.avatar_url,
@@ -340,6 +391,39 @@ class SubscriptionOrganization(Schema):
     platform: Platforms
     avatar_url: str
 
+    @classmethod
+    def from_db(cls, organization: OrganizationModel) -> Self:
+        return _construct_from_db(cls, organization)
+
+
+class SubscriptionSchemaCache:
+    """
+    Memoizes the nested schemas shared by a list of subscriptions,
+    so each tier or organization is only built once per response.
+    """
+
+    def __init__(self) -> None:
+        self._subscription_tiers: dict[uuid.UUID, SubscriptionTier] = {}
+        self._organizations: dict[uuid.UUID, SubscriptionOrganization] = {}
+
+    def get_subscription_tier(
+        self, subscription_tier: SubscriptionTierModel
+    ) -> SubscriptionTier:
+        schema = self._subscription_tiers.get(subscription_tier.id)
+        if schema is None:
+            schema = SubscriptionTier.from_db(subscription_tier)
+            self._subscription_tiers[subscription_tier.id] = schema
+        return schema
+
+    def get_organization(
+        self, organization: OrganizationModel
+    ) -> SubscriptionOrganization:
+        schema = self._organizations.get(organization.id)
+        if schema is None:
+            schema = SubscriptionOrganization.from_db(organization)
+            self._organizations[organization.id] = schema
+        return schema
+
 
 class Subscription(TimestampedSchema):
     id: UUID4
@@ -365,29 +449,26 @@ class Subscription(TimestampedSchema):
         orm_mode = False
 
     @classmethod
-    def from_db(cls, subscription: SubscriptionModel, include_user_email: bool) -> Self:
-        return cls(
-            id=subscription.id,
-            status=subscription.status,
-            current_period_start=subscription.current_period_start,
-            current_period_end=subscription.current_period_end,
-            cancel_at_period_end=subscription.cancel_at_period_end,
-            started_at=subscription.started_at,
-            ended_at=subscription.ended_at,
-            price_currency=subscription.price_currency,
-            price_amount=subscription.price_amount,
-            user_id=subscription.user_id,
-            organization_id=subscription.organization_id,
-            subscription_tier_id=subscription.subscription_tier_id,
+    def from_db(
+        cls,
+        subscription: SubscriptionModel,
+        include_user_email: bool,
+        cache: SubscriptionSchemaCache | None = None,
+    ) -> Self:
+        if cache is None:
+            cache = SubscriptionSchemaCache()
+        return _construct_from_db(
+            cls,
+            subscription,
             user=SubscriptionUser.from_db(
                 subscription.user, include_user_email=include_user_email
             ),
-            organization=SubscriptionOrganization.from_orm(subscription.organization)
+            organization=cache.get_organization(subscription.organization)
             if subscription.organization
             else None,
-            subscription_tier=SubscriptionTier.from_orm(subscription.subscription_tier),
-            created_at=subscription.created_at,
-            modified_at=subscription.modified_at,
+            subscription_tier=cache.get_subscription_tier(
+                subscription.subscription_tier
+            ),
         )
 
 
@@ -418,15 +499,24 @@ class SubscriptionSummary(Schema):
         orm_mode = False
 
     @classmethod
-    def from_db(cls, subscription: SubscriptionModel, include_user_email: bool) -> Self:
-        return cls(
+    def from_db(
+        cls,
+        subscription: SubscriptionModel,
+        include_user_email: bool,
+        cache: SubscriptionSchemaCache | None = None,
+    ) -> Self:
+        if cache is None:
+            cache = SubscriptionSchemaCache()
+        return cls.construct(
             user=SubscriptionUser.from_db(
                 subscription.user, include_user_email=include_user_email
             ),
-            organization=SubscriptionOrganization.from_orm(subscription.organization)
+            organization=cache.get_organization(subscription.organization)
             if subscription.organization
             else None,
-            subscription_tier=SubscriptionTier.from_orm(subscription.subscription_tier),
+            subscription_tier=cache.get_subscription_tier(
+                subscription.subscription_tier
+            ),
         )
 
 
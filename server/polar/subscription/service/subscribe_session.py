@@ -194,19 +194,13 @@ class SubscribeSessionService:
         except KeyError:
             raise ResourceNotFound()
 
-        subscription_tier = await subscription_tier_service.get(
+        subscription_tier = await subscription_tier_service.get_loaded(
             session, uuid.UUID(subscription_tier_id)
         )
 
         if subscription_tier is None:
             raise ResourceNotFound()
 
-        subscription_tier = (
-            await subscription_tier_service.with_organization_or_repository(
-                session, subscription_tier
-            )
-        )
-
         return SubscribeSession.from_db(checkout_session, subscription_tier)
 
     async def _get_organization(
@@ -183,7 +183,7 @@ class SubscriptionService(ResourceServiceReader[Subscription]):
             query = query.where(Subscription.deleted_at.is_(None))
 
         query = query.options(
-            joinedload(Subscription.user).joinedload(User.oauth_accounts),
+            joinedload(Subscription.user).undefer(User.has_github_account),
             joinedload(Subscription.organization),
         )
 
@@ -271,7 +271,7 @@ class SubscriptionService(ResourceServiceReader[Subscription]):
             contains_eager(Subscription.subscription_tier)
             .selectinload(SubscriptionTier.subscription_tier_benefits)
             .joinedload(SubscriptionTierBenefit.subscription_benefit),
-            contains_eager(Subscription.user).joinedload(User.oauth_accounts),
+            contains_eager(Subscription.user).undefer(User.has_github_account),
             joinedload(Subscription.organization),
         )
 
@@ -291,7 +291,7 @@ class SubscriptionService(ResourceServiceReader[Subscription]):
             select(Subscription)
             .join(Subscription.subscription_tier)
             .options(
-                joinedload(Subscription.user).joinedload(User.oauth_accounts),
+                joinedload(Subscription.user).undefer(User.has_github_account),
                 joinedload(Subscription.organization),
                 contains_eager(Subscription.subscription_tier)
                 .selectinload(SubscriptionTier.subscription_tier_benefits)
@@ -54,6 +54,21 @@ class RepositoryDoesNotExist(SubscriptionBenefitError):
         super().__init__(message, 422)
 
 
+class SubscriptionBenefitTypeMismatch(SubscriptionBenefitError):
+    def __init__(
+        self,
+        subscription_benefit_type: SubscriptionBenefitType,
+        update_type: SubscriptionBenefitType,
+    ) -> None:
+        self.subscription_benefit_type = subscription_benefit_type
+        self.update_type = update_type
+        message = (
+            f"Can't apply a {update_type} update "
+            f"to a {subscription_benefit_type} subscription benefit."
+        )
+        super().__init__(message, 422)
+
+
 class SubscriptionBenefitService(
     ResourceService[
         SubscriptionBenefit, SubscriptionBenefitCreate, SubscriptionBenefitUpdate
@@ -169,8 +184,13 @@ class SubscriptionBenefitService(
         if not await authz.can(user, AccessType.write, subscription_benefit):
             raise NotPermitted()
 
+        if update_schema.type != subscription_benefit.type:
+            raise SubscriptionBenefitTypeMismatch(
+                subscription_benefit.type, update_schema.type
+            )
+
         updated_subscription_benefit = await subscription_benefit.update(
-            session, **update_schema.dict(exclude_unset=True)
+            session, **update_schema.dict(exclude_unset=True, exclude={"type"})
         )
 
         await subscription_benefit_grant_service.enqueue_benefit_grant_updates(
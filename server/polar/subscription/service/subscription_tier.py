@@ -11,7 +11,7 @@ from sqlalchemy import (
     update,
 )
 from sqlalchemy.exc import InvalidRequestError
-from sqlalchemy.orm import aliased, contains_eager, selectinload
+from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload
 
 from polar.account.service import account as account_service
 from polar.authz.service import AccessType, Authz, Subject
@@ -167,6 +167,24 @@ class SubscriptionTierService(
         result = await session.execute(statement)
         return result.scalar_one_or_none()
 
+    async def get_loaded(
+        self, session: AsyncSession, id: uuid.UUID
+    ) -> SubscriptionTier | None:
+        statement = (
+            select(SubscriptionTier)
+            .where(SubscriptionTier.id == id, SubscriptionTier.deleted_at.is_(None))
+            .options(
+                joinedload(SubscriptionTier.organization),
+                joinedload(SubscriptionTier.repository),
+                selectinload(SubscriptionTier.subscription_tier_benefits).joinedload(
+                    SubscriptionTierBenefit.subscription_benefit
+                ),
+            )
+        )
+
+        result = await session.execute(statement)
+        return result.scalar_one_or_none()
+
     async def get_by_stripe_product_id(
         self, session: AsyncSession, stripe_product_id: str
     ) -> SubscriptionTier | None:
@@ -1,10 +1,20 @@
 import uuid
 from collections.abc import Sequence
 from enum import StrEnum
-from typing import Any, cast
-
-from sqlalchemy import Select, UnaryExpression, asc, desc, func, or_, select
-from sqlalchemy.orm import aliased, joinedload, subqueryload
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    ColumnExpressionArgument,
+    Select,
+    UnaryExpression,
+    asc,
+    desc,
+    func,
+    or_,
+    select,
+)
+from sqlalchemy.orm import aliased, joinedload, selectinload
 
 from polar.authz.service import AccessType, Authz
 from polar.exceptions import NotPermitted, ResourceNotFound
@@ -31,11 +41,59 @@ from ..schemas import (
 from .base import BaseTransactionService
 
 
+def _sum_or_zero(
+    column: ColumnExpressionArgument[int], *filters: ColumnExpressionArgument[bool]
+) -> ColumnElement[int]:
+    aggregate = func.sum(column)
+    if filters:
+        aggregate = aggregate.filter(*filters)
+    return func.coalesce(aggregate, 0)
+
+
+_SUMMARY_STATEMENT = select(
+    Transaction.currency,
+    Transaction.account_currency,
+    _sum_or_zero(Transaction.amount),
+    _sum_or_zero(Transaction.account_amount),
+    _sum_or_zero(Transaction.amount, Transaction.type == TransactionType.payout),
+    _sum_or_zero(
+        Transaction.account_amount, Transaction.type == TransactionType.payout
+    ),
+).group_by(Transaction.currency, Transaction.account_currency)
+
+
+_PaymentUserOrganization = aliased(UserOrganization, name="payment_user_organization")
+
+
 class SearchSortProperty(StrEnum):
     created_at = "created_at"
     amount = "amount"
 
 
+_DEFAULT_SORTING: Sorting[SearchSortProperty] = (SearchSortProperty.created_at, True)
+_DEFAULT_ORDER_BY = Transaction.created_at.desc()
+
+_TRANSACTION_DETAIL_OPTIONS = (
+    # Pledge
+    selectinload(Transaction.pledge).options(
+        # Pledge.issue
+        joinedload(Pledge.issue).options(
+            joinedload(Issue.repository),
+            joinedload(Issue.organization),
+        )
+    ),
+    # IssueReward
+    selectinload(Transaction.issue_reward),
+    # Subscription
+    selectinload(Transaction.subscription).options(
+        joinedload(Subscription.subscription_tier).options(
+            joinedload(SubscriptionTier.organization),
+            joinedload(SubscriptionTier.repository),
+        ),
+    ),
+)
+
+
 class TransactionService(BaseTransactionService):
     async def search(
         self,
@@ -47,31 +105,11 @@ class TransactionService(BaseTransactionService):
         payment_user_id: uuid.UUID | None = None,
         payment_organization_id: uuid.UUID | None = None,
         pagination: PaginationParams,
-        sorting: list[Sorting[SearchSortProperty]] = [
-            (SearchSortProperty.created_at, True)
-        ],
+        sorting: Sequence[Sorting[SearchSortProperty]] = (_DEFAULT_SORTING,),
     ) -> tuple[Sequence[Transaction], int]:
         statement = self._get_readable_transactions_statement(user)
 
-        statement = statement.options(
-            # Pledge
-            subqueryload(Transaction.pledge).options(
-                # Pledge.issue
-                joinedload(Pledge.issue).options(
-                    joinedload(Issue.repository),
-                    joinedload(Issue.organization),
-                )
-            ),
-            # IssueReward
-            subqueryload(Transaction.issue_reward),
-            # Subscription
-            subqueryload(Transaction.subscription).options(
-                joinedload(Subscription.subscription_tier).options(
-                    joinedload(SubscriptionTier.organization),
-                    joinedload(SubscriptionTier.repository),
-                ),
-            ),
-        )
+        statement = statement.options(*_TRANSACTION_DETAIL_OPTIONS)
 
         if type is not None:
             statement = statement.where(Transaction.type == type)
@@ -84,13 +122,17 @@ class TransactionService(BaseTransactionService):
                 Transaction.payment_organization_id == payment_organization_id
             )
 
-        order_by_clauses: list[UnaryExpression[Any]] = []
-        for criterion, is_desc in sorting:
-            clause_function = desc if is_desc else asc
-            if criterion == SearchSortProperty.created_at:
-                order_by_clauses.append(clause_function(Transaction.created_at))
-            elif criterion == SearchSortProperty.amount:
-                order_by_clauses.append(clause_function(Transaction.amount))
+        if len(sorting) == 1 and sorting[0] == _DEFAULT_SORTING:
+            statement = statement.order_by(_DEFAULT_ORDER_BY)
+        else:
+            order_by_clauses: list[UnaryExpression[Any]] = []
+            for criterion, is_desc in sorting:
+                clause_function = desc if is_desc else asc
+                if criterion == SearchSortProperty.created_at:
+                    order_by_clauses.append(clause_function(Transaction.created_at))
+                elif criterion == SearchSortProperty.amount:
+                    order_by_clauses.append(clause_function(Transaction.amount))
+            statement = statement.order_by(*order_by_clauses)
 
         results, count = await paginate(session, statement, pagination=pagination)
 
@@ -99,28 +141,12 @@ class TransactionService(BaseTransactionService):
     async def lookup(
         self, session: AsyncSession, id: uuid.UUID, user: User
     ) -> Transaction:
-        statement = (
-            self._get_readable_transactions_statement(user)
-            .options(
-                # Pledge
-                subqueryload(Transaction.pledge).options(
-                    # Pledge.issue
-                    joinedload(Pledge.issue).options(
-                        joinedload(Issue.repository),
-                        joinedload(Issue.organization),
-                    )
-                ),
-                # IssueReward
-                subqueryload(Transaction.issue_reward),
-                # Subscription
-                subqueryload(Transaction.subscription).options(
-                    joinedload(Subscription.subscription_tier),
-                ),
-                # Paid transactions
-                subqueryload(Transaction.paid_transactions),
-            )
-            .where(Transaction.id == id)
-        )
+        statement = self._get_readable_transactions_statement(user)
+        statement = statement.options(
+            *_TRANSACTION_DETAIL_OPTIONS,
+            # Paid transactions
+            selectinload(Transaction.paid_transactions),
+        ).where(Transaction.id == id)
         result = await session.execute(statement)
         transaction = result.scalar_one_or_none()
         if transaction is None:
@@ -134,34 +160,7 @@ class TransactionService(BaseTransactionService):
         if not await authz.can(user, AccessType.read, account):
             raise NotPermitted()
 
-        statement = (
-            select(
-                Transaction.currency,
-                Transaction.account_currency,
-                cast(type[int], func.coalesce(func.sum(Transaction.amount), 0)),
-                cast(type[int], func.coalesce(func.sum(Transaction.account_amount), 0)),
-                cast(
-                    type[int],
-                    func.coalesce(
-                        func.sum(Transaction.amount).filter(
-                            Transaction.type == TransactionType.payout
-                        ),
-                        0,
-                    ),
-                ),
-                cast(
-                    type[int],
-                    func.coalesce(
-                        func.sum(Transaction.account_amount).filter(
-                            Transaction.type == TransactionType.payout
-                        ),
-                        0,
-                    ),
-                ),
-            )
-            .where(Transaction.account_id == account.id)
-            .group_by(Transaction.currency, Transaction.account_currency)
-        )
+        statement = _SUMMARY_STATEMENT.where(Transaction.account_id == account.id)
 
         result = await session.execute(statement)
         (
@@ -189,7 +188,6 @@ class TransactionService(BaseTransactionService):
         )
 
     def _get_readable_transactions_statement(self, user: User) -> Select[Any]:
-        PaymentUserOrganization = aliased(UserOrganization)
         statement = (
             select(Transaction)
             .join(Transaction.account, isouter=True)
@@ -205,9 +203,9 @@ class TransactionService(BaseTransactionService):
             )
             .join(User, onclause=User.account_id == Account.id, isouter=True)
             .join(
-                PaymentUserOrganization,
+                _PaymentUserOrganization,
                 onclause=Transaction.payment_organization_id
-                == PaymentUserOrganization.organization_id,
+                == _PaymentUserOrganization.organization_id,
                 isouter=True,
             )
             .where(
@@ -215,7 +213,7 @@ class TransactionService(BaseTransactionService):
                     User.id == user.id,
                     UserOrganization.user_id == user.id,
                     Transaction.payment_user_id == user.id,
-                    PaymentUserOrganization.user_id == user.id,
+                    _PaymentUserOrganization.user_id == user.id,
                 )
             )
         )
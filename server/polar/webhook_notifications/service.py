@@ -2,6 +2,7 @@ from collections.abc import Sequence
 from uuid import UUID
 
 import structlog
+from sqlalchemy import lambda_stmt
 
 from polar.kit.utils import utc_now
 from polar.models.webhook_notifications import WebhookNotification
@@ -30,13 +31,15 @@ class WebhookNotificationService:
         session: AsyncSession,
         id: UUID,
     ) -> WebhookNotification | None:
-        stmt = sql.select(WebhookNotification).where(
-            WebhookNotification.id == id,
-            WebhookNotification.deleted_at.is_(None),
+        stmt = lambda_stmt(
+            lambda: sql.select(WebhookNotification).where(
+                WebhookNotification.id == id,
+                WebhookNotification.deleted_at.is_(None),
+            )
         )
 
         res = await session.execute(stmt)
-        return res.scalars().unique().one_or_none()
+        return res.scalar_one_or_none()
 
     async def search(
         self,
@@ -44,13 +47,15 @@ class WebhookNotificationService:
         *,
         organization_id: UUID,
     ) -> Sequence[WebhookNotification]:
-        stmt = sql.select(WebhookNotification).where(
-            WebhookNotification.organization_id == organization_id,
-            WebhookNotification.deleted_at.is_(None),
+        stmt = lambda_stmt(
+            lambda: sql.select(WebhookNotification).where(
+                WebhookNotification.organization_id == organization_id,
+                WebhookNotification.deleted_at.is_(None),
+            )
         )
 
         res = await session.execute(stmt)
-        return res.scalars().unique().all()
+        return res.scalars().all()
 
     async def update(
         self,
@@ -26,16 +26,25 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest_asyncio.fixture(scope="session")
+async def base_client() -> AsyncGenerator[AsyncClient, None]:
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+
+
 @pytest_asyncio.fixture()
 async def client(
-    request: pytest.FixtureRequest, session: AsyncSession, auth_jwt: str
+    request: pytest.FixtureRequest,
+    session: AsyncSession,
+    auth_jwt: str,
+    base_client: AsyncClient,
 ) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides[get_db_session] = lambda: session
 
-    cookies = {}
     authenticated_marker = request.node.get_closest_marker("authenticated")
     if authenticated_marker is not None:
-        cookies[settings.AUTH_COOKIE_KEY] = auth_jwt
+        base_client.cookies.set(settings.AUTH_COOKIE_KEY, auth_jwt)
 
-    async with AsyncClient(app=app, base_url="http://test", cookies=cookies) as client:
-        yield client
+    yield base_client
+
+    base_client.cookies.clear()
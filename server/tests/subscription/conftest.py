@@ -2,6 +2,7 @@ import random
 import string
 from collections.abc import Iterator
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import MagicMock
 from uuid import UUID
@@ -39,9 +40,19 @@ def rstr(prefix: str) -> str:
     return f"{prefix}.{''.join(random.choices(string.ascii_uppercase + string.digits, k=6))}"
 
 
+@pytest.fixture(scope="package")
+def package_stripe_service_mock() -> MagicMock:
+    return MagicMock(spec=StripeService)
+
+
 @pytest.fixture(autouse=True)
-def stripe_service_mock(mocker: MockerFixture) -> MagicMock:
-    mock = MagicMock(spec=StripeService)
+def stripe_service_mock(
+    mocker: MockerFixture, package_stripe_service_mock: MagicMock
+) -> Iterator[MagicMock]:
+    mock = package_stripe_service_mock
+    mock.create_product_with_price.return_value = SimpleNamespace(
+        id="PRODUCT_ID", default_price="PRICE_ID"
+    )
     mocker.patch(
         "polar.subscription.service.subscription_tier.stripe_service", new=mock
     )
@@ -49,7 +60,10 @@ def stripe_service_mock(mocker: MockerFixture) -> MagicMock:
         "polar.subscription.service.subscribe_session.stripe_service", new=mock
     )
     mocker.patch("polar.subscription.service.subscription.stripe_service", new=mock)
-    return mock
+
+    yield mock
+
+    mock.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture(autouse=True, scope="package")
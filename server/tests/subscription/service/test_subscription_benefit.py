@@ -22,6 +22,7 @@ from polar.subscription.schemas import (
 from polar.subscription.service.subscription_benefit import (  # type: ignore[attr-defined]
     OrganizationDoesNotExist,
     RepositoryDoesNotExist,
+    SubscriptionBenefitTypeMismatch,
     subscription_benefit_grant_service,
 )
 from polar.subscription.service.subscription_benefit import (
@@ -323,7 +324,8 @@ class TestUserUpdate:
         subscription_benefit_organization: SubscriptionBenefit,
     ) -> None:
         update_schema = SubscriptionBenefitCustomUpdate(
-            description="Subscription Benefit Update"
+            type=SubscriptionBenefitType.custom,
+            description="Subscription Benefit Update",
         )
         with pytest.raises(NotPermitted):
             await subscription_benefit_service.user_update(
@@ -346,7 +348,7 @@ class TestUserUpdate:
         )
 
         update_schema = SubscriptionBenefitCustomUpdate(
-            description="Description update"
+            type=SubscriptionBenefitType.custom, description="Description update"
         )
         updated_subscription_benefit = await subscription_benefit_service.user_update(
             session, authz, subscription_benefit_organization, update_schema, user
@@ -355,6 +357,28 @@ class TestUserUpdate:
 
         enqueue_benefit_grant_updates_mock.assert_awaited_once()
 
+    async def test_type_mismatch(
+        self,
+        session: AsyncSession,
+        authz: Authz,
+        user: User,
+        organization: Organization,
+        user_organization_admin: UserOrganization,
+    ) -> None:
+        subscription_benefit = await create_subscription_benefit(
+            session,
+            type=SubscriptionBenefitType.articles,
+            organization=organization,
+            properties={"paid_articles": False},
+        )
+        update_schema = SubscriptionBenefitCustomUpdate(
+            type=SubscriptionBenefitType.custom, description="Description update"
+        )
+        with pytest.raises(SubscriptionBenefitTypeMismatch):
+            await subscription_benefit_service.user_update(
+                session, authz, subscription_benefit, update_schema, user
+            )
+
 
 @pytest.mark.asyncio
 class TestUserDelete:
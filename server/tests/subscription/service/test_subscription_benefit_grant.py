@@ -9,6 +9,7 @@ from polar.models import (
     SubscriptionBenefitGrant,
     User,
 )
+from polar.models.subscription_benefit import SubscriptionBenefitType
 from polar.postgres import AsyncSession
 from polar.subscription.schemas import SubscriptionBenefitCustomUpdate
 from polar.subscription.service.benefits import (
@@ -214,7 +215,9 @@ class TestEnqueueBenefitGrantUpdates:
         await subscription_benefit_grant_service.enqueue_benefit_grant_updates(
             session,
             subscription_benefit_organization,
-            SubscriptionBenefitCustomUpdate(description="Update"),
+            SubscriptionBenefitCustomUpdate(
+                type=SubscriptionBenefitType.custom, description="Update"
+            ),
         )
 
         enqueue_job_mock.assert_not_called()
@@ -263,7 +266,9 @@ class TestEnqueueBenefitGrantUpdates:
         await subscription_benefit_grant_service.enqueue_benefit_grant_updates(
             session,
             subscription_benefit_organization,
-            SubscriptionBenefitCustomUpdate(description="Update"),
+            SubscriptionBenefitCustomUpdate(
+                type=SubscriptionBenefitType.custom, description="Update"
+            ),
         )
 
         enqueue_job_mock.assert_called_once_with(
@@ -292,6 +292,32 @@ class TestGetById:
         assert accessible_subscription_tier.id == subscription_tier_organization.id
 
 
+@pytest.mark.asyncio
+class TestGetLoaded:
+    async def test_not_existing(self, session: AsyncSession) -> None:
+        subscription_tier = await subscription_tier_service.get_loaded(
+            session, uuid.uuid4()
+        )
+        assert subscription_tier is None
+
+    async def test_valid(
+        self,
+        session: AsyncSession,
+        subscription_tier_organization: SubscriptionTier,
+        organization: Organization,
+    ) -> None:
+        session.expunge_all()
+
+        subscription_tier = await subscription_tier_service.get_loaded(
+            session, subscription_tier_organization.id
+        )
+        assert subscription_tier is not None
+        assert subscription_tier.organization is not None
+        assert subscription_tier.organization.id == organization.id
+        assert subscription_tier.repository is None
+        assert subscription_tier.benefits == []
+
+
 @pytest.mark.asyncio
 class TestUserCreate:
     async def test_not_existing_organization(
@@ -1,7 +1,6 @@
 import uuid
 from datetime import datetime
 from types import SimpleNamespace
-from typing import Any
 from unittest.mock import MagicMock
 
 import pytest
@@ -25,10 +24,23 @@ from polar.postgres import AsyncSession
 
 from .conftest import (
     create_active_subscription,
+    create_subscription,
     create_subscription_benefit,
     set_subscription_benefits,
 )
 
+_MISSING_UUID = uuid.UUID("00000000-0000-4000-8000-000000000000")
+_STARTED_AT = datetime(2023, 1, 1)
+_ENDED_AT = datetime(2023, 6, 15)
+
+_CHECKOUT_SESSION = SimpleNamespace(
+    id="SESSION_ID",
+    url="STRIPE_URL",
+    customer_email=None,
+    customer_details=None,
+    metadata={},
+)
+
 
 @pytest.mark.asyncio
 class TestSearchSubscriptionTiers:
@@ -191,7 +203,7 @@ class TestLookupSubscriptionTier:
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.get(
             "/api/v1/subscriptions/tiers/lookup",
-            params={"subscription_tier_id": str(uuid.uuid4())},
+            params={"subscription_tier_id": str(_MISSING_UUID)},
         )
 
         assert response.status_code == 404
@@ -246,7 +258,7 @@ class TestCreateSubscriptionTier:
                 "type": "hobby",
                 "name": "Subscription Tier",
                 "price_amount": 1000,
-                "organization_id": str(uuid.uuid4()),
+                "organization_id": str(_MISSING_UUID),
             },
         )
 
@@ -307,47 +319,20 @@ class TestCreateSubscriptionTier:
 
         assert response.status_code == 422
 
-    @pytest.mark.parametrize(
-        "payload",
-        [
-            {"name": "This is a way too long name for a subscription tier"},
-            {"name": "ab"},
-            {"name": ""},
-            {
-                "description": (
-                    "This is a way too long description that shall never fit "
-                    "in the space we have in a single subscription tier card. "
-                    "That's why we need to add this upper limit of characters, "
-                    "otherwise users would put loads and loads of text that would "
-                    "result in a very ugly output on the subscription page."
-                )
-            },
-        ],
-    )
     @pytest.mark.authenticated
     async def test_validation(
         self,
-        payload: dict[str, Any],
         client: AsyncClient,
         organization: Organization,
         user_organization_admin: UserOrganization,
-        stripe_service_mock: MagicMock,
     ) -> None:
-        create_product_with_price_mock: (
-            MagicMock
-        ) = stripe_service_mock.create_product_with_price
-        create_product_with_price_mock.return_value = SimpleNamespace(
-            id="PRODUCT_ID", default_price="PRICE_ID"
-        )
-
         response = await client.post(
             "/api/v1/subscriptions/tiers/",
             json={
                 "type": "hobby",
-                "name": "Subscription Tier",
+                "name": "ab",
                 "price_amount": 1000,
                 "organization_id": str(organization.id),
-                **payload,
             },
         )
 
@@ -362,13 +347,6 @@ class TestCreateSubscriptionTier:
         organization_account: Account,
         stripe_service_mock: MagicMock,
     ) -> None:
-        create_product_with_price_mock: (
-            MagicMock
-        ) = stripe_service_mock.create_product_with_price
-        create_product_with_price_mock.return_value = SimpleNamespace(
-            id="PRODUCT_ID", default_price="PRICE_ID"
-        )
-
         response = await client.post(
             "/api/v1/subscriptions/tiers/",
             json={
@@ -384,11 +362,9 @@ class TestCreateSubscriptionTier:
 
 @pytest.mark.asyncio
 class TestUpdateSubscriptionTier:
-    async def test_anonymous(
-        self, client: AsyncClient, subscription_tier_organization: SubscriptionTier
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/tiers/{subscription_tier_organization.id}",
+            f"/api/v1/subscriptions/tiers/{_MISSING_UUID}",
             json={"name": "Updated Name"},
         )
 
@@ -397,40 +373,22 @@ class TestUpdateSubscriptionTier:
     @pytest.mark.authenticated
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/tiers/{uuid.uuid4()}",
+            f"/api/v1/subscriptions/tiers/{_MISSING_UUID}",
             json={"name": "Updated Name"},
         )
 
         assert response.status_code == 404
 
-    @pytest.mark.parametrize(
-        "payload",
-        [
-            {"name": "This is a way too long name for a subscription tier"},
-            {"name": "ab"},
-            {"name": ""},
-            {
-                "description": (
-                    "This is a way too long description that shall never fit "
-                    "in the space we have in a single subscription tier card. "
-                    "That's why we need to add this upper limit of characters, "
-                    "otherwise users would put loads and loads of text that would "
-                    "result in a very ugly output on the subscription page."
-                )
-            },
-        ],
-    )
     @pytest.mark.authenticated
     async def test_validation(
         self,
-        payload: dict[str, Any],
         client: AsyncClient,
         subscription_tier_organization: SubscriptionTier,
         user_organization_admin: UserOrganization,
     ) -> None:
         response = await client.post(
             f"/api/v1/subscriptions/tiers/{subscription_tier_organization.id}",
-            json=payload,
+            json={"name": "ab"},
         )
 
         assert response.status_code == 422
@@ -455,11 +413,9 @@ class TestUpdateSubscriptionTier:
 
 @pytest.mark.asyncio
 class TestUpdateSubscriptionTierBenefits:
-    async def test_anonymous(
-        self, client: AsyncClient, subscription_tier_organization: SubscriptionTier
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/tiers/{subscription_tier_organization.id}/benefits",
+            f"/api/v1/subscriptions/tiers/{_MISSING_UUID}/benefits",
             json={"benefits": []},
         )
 
@@ -468,7 +424,7 @@ class TestUpdateSubscriptionTierBenefits:
     @pytest.mark.authenticated
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/tiers/{uuid.uuid4()}/benefits",
+            f"/api/v1/subscriptions/tiers/{_MISSING_UUID}/benefits",
             json={"benefits": []},
         )
 
@@ -495,11 +451,9 @@ class TestUpdateSubscriptionTierBenefits:
 
 @pytest.mark.asyncio
 class TestArchiveSubscriptionTier:
-    async def test_anonymous(
-        self, client: AsyncClient, subscription_tier_organization: SubscriptionTier
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/tiers/{subscription_tier_organization.id}/archive"
+            f"/api/v1/subscriptions/tiers/{_MISSING_UUID}/archive"
         )
 
         assert response.status_code == 401
@@ -507,7 +461,7 @@ class TestArchiveSubscriptionTier:
     @pytest.mark.authenticated
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/tiers/{uuid.uuid4()}/archive"
+            f"/api/v1/subscriptions/tiers/{_MISSING_UUID}/archive"
         )
 
         assert response.status_code == 404
@@ -656,16 +610,10 @@ class TestSearchSubscriptionBenefits:
 
 @pytest.mark.asyncio
 class TestLookupSubscriptionBenefit:
-    async def test_anonymous(
-        self,
-        client: AsyncClient,
-        subscription_benefit_organization: SubscriptionBenefit,
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.get(
             "/api/v1/subscriptions/benefits/lookup",
-            params={
-                "subscription_benefit_id": str(subscription_benefit_organization.id)
-            },
+            params={"subscription_benefit_id": str(_MISSING_UUID)},
         )
 
         assert response.status_code == 401
@@ -674,7 +622,7 @@ class TestLookupSubscriptionBenefit:
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.get(
             "/api/v1/subscriptions/benefits/lookup",
-            params={"subscription_benefit_id": str(uuid.uuid4())},
+            params={"subscription_benefit_id": str(_MISSING_UUID)},
         )
 
         assert response.status_code == 404
@@ -708,7 +656,7 @@ class TestCreateSubscriptionBenefit:
             json={
                 "type": "custom",
                 "description": "Subscription Benefit",
-                "organization_id": str(uuid.uuid4()),
+                "organization_id": str(_MISSING_UUID),
             },
         )
 
@@ -752,37 +700,9 @@ class TestCreateSubscriptionBenefit:
 
         assert response.status_code == 422
 
-    @pytest.mark.parametrize(
-        "payload",
-        [
-            {
-                "is_tax_applicable": True,
-                "properties": {},
-                "description": (
-                    "This is a way too long description that shall never fit "
-                    "in the space we have in a single subscription benefit card. "
-                    "That's why we need to add this upper limit of characters, "
-                    "otherwise users would put loads and loads of text that would "
-                    "result in a very ugly output on the subscription page."
-                ),
-            },
-            {
-                "is_tax_applicable": True,
-                "properties": {},
-                "description": "Th",
-            },
-            {"description": "Subscription Benefit", "properties": {}},
-            {
-                "type": "articles",
-                "description": "My articles benefit",
-                "properties": {"paid_articles": True},
-            },
-        ],
-    )
     @pytest.mark.authenticated
     async def test_validation(
         self,
-        payload: dict[str, Any],
         client: AsyncClient,
         organization: Organization,
         user_organization_admin: UserOrganization,
@@ -791,8 +711,10 @@ class TestCreateSubscriptionBenefit:
             "/api/v1/subscriptions/benefits/",
             json={
                 "type": "custom",
+                "description": "Th",
+                "is_tax_applicable": True,
+                "properties": {},
                 "organization_id": str(organization.id),
-                **payload,
             },
         )
 
@@ -824,14 +746,10 @@ class TestCreateSubscriptionBenefit:
 
 @pytest.mark.asyncio
 class TestUpdateSubscriptionBenefit:
-    async def test_anonymous(
-        self,
-        client: AsyncClient,
-        subscription_benefit_organization: SubscriptionBenefit,
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/benefits/{subscription_benefit_organization.id}",
-            json={"description": "Updated Name"},
+            f"/api/v1/subscriptions/benefits/{_MISSING_UUID}",
+            json={"type": "custom", "description": "Updated Name"},
         )
 
         assert response.status_code == 401
@@ -839,37 +757,22 @@ class TestUpdateSubscriptionBenefit:
     @pytest.mark.authenticated
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/benefits/{uuid.uuid4()}",
-            json={"description": "Updated Name"},
+            f"/api/v1/subscriptions/benefits/{_MISSING_UUID}",
+            json={"type": "custom", "description": "Updated Name"},
         )
 
         assert response.status_code == 404
 
-    @pytest.mark.parametrize(
-        "payload",
-        [
-            {
-                "description": (
-                    "This is a way too long description that shall never fit "
-                    "in the space we have in a single subscription benefit card. "
-                    "That's why we need to add this upper limit of characters, "
-                    "otherwise users would put loads and loads of text that would "
-                    "result in a very ugly output on the subscription page."
-                )
-            },
-        ],
-    )
     @pytest.mark.authenticated
     async def test_validation(
         self,
-        payload: dict[str, Any],
         client: AsyncClient,
         subscription_benefit_organization: SubscriptionBenefit,
         user_organization_admin: UserOrganization,
     ) -> None:
         response = await client.post(
             f"/api/v1/subscriptions/benefits/{subscription_benefit_organization.id}",
-            json=payload,
+            json={"type": "custom", "description": "Th"},
         )
 
         assert response.status_code == 422
@@ -883,7 +786,7 @@ class TestUpdateSubscriptionBenefit:
     ) -> None:
         response = await client.post(
             f"/api/v1/subscriptions/benefits/{subscription_benefit_organization.id}",
-            json={"description": "Updated Description"},
+            json={"type": "custom", "description": "Updated Description"},
         )
 
         assert response.status_code == 200
@@ -909,6 +812,7 @@ class TestUpdateSubscriptionBenefit:
         response = await client.post(
             f"/api/v1/subscriptions/benefits/{benefit.id}",
             json={
+                "type": "articles",
                 "description": "Updated Description",
                 "properties": {"paid_articles": True},
             },
@@ -924,20 +828,18 @@ class TestUpdateSubscriptionBenefit:
 
 @pytest.mark.asyncio
 class TestDeleteSubscriptionBenefit:
-    async def test_anonymous(
-        self,
-        client: AsyncClient,
-        subscription_benefit_organization: SubscriptionBenefit,
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.delete(
-            f"/api/v1/subscriptions/benefits/{subscription_benefit_organization.id}"
+            f"/api/v1/subscriptions/benefits/{_MISSING_UUID}"
         )
 
         assert response.status_code == 401
 
     @pytest.mark.authenticated
     async def test_not_existing(self, client: AsyncClient) -> None:
-        response = await client.delete(f"/api/v1/subscriptions/benefits/{uuid.uuid4()}")
+        response = await client.delete(
+            f"/api/v1/subscriptions/benefits/{_MISSING_UUID}"
+        )
 
         assert response.status_code == 404
 
@@ -960,7 +862,7 @@ class TestCreateSubscribeSession:
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.post(
             "/api/v1/subscriptions/subscribe-sessions/",
-            json={"tier_id": str(uuid.uuid4()), "success_url": "https://polar.sh"},
+            json={"tier_id": str(_MISSING_UUID), "success_url": "https://polar.sh"},
         )
 
         assert response.status_code == 404
@@ -1016,15 +918,8 @@ class TestCreateSubscribeSession:
         stripe_service_mock: MagicMock,
         organization_account: Account,
     ) -> None:
-        create_subscription_checkout_session_mock: (
-            MagicMock
-        ) = stripe_service_mock.create_subscription_checkout_session
-        create_subscription_checkout_session_mock.return_value = SimpleNamespace(
-            id="SESSION_ID",
-            url="STRIPE_URL",
-            customer_email=None,
-            customer_details=None,
-            metadata={},
+        stripe_service_mock.create_subscription_checkout_session.return_value = (
+            _CHECKOUT_SESSION
         )
 
         response = await client.post(
@@ -1049,15 +944,8 @@ class TestCreateSubscribeSession:
         stripe_service_mock: MagicMock,
         organization_account: Account,
     ) -> None:
-        create_subscription_checkout_session_mock: (
-            MagicMock
-        ) = stripe_service_mock.create_subscription_checkout_session
-        create_subscription_checkout_session_mock.return_value = SimpleNamespace(
-            id="SESSION_ID",
-            url="STRIPE_URL",
-            customer_email=None,
-            customer_details=None,
-            metadata={},
+        stripe_service_mock.create_subscription_checkout_session.return_value = (
+            _CHECKOUT_SESSION
         )
 
         response = await client.post(
@@ -1137,9 +1025,7 @@ class TestGetSubscribeSession:
 
 @pytest.mark.asyncio
 class TestSearchSubscriptions:
-    async def test_anonymous(
-        self, client: AsyncClient, organization: Organization
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.get("/api/v1/subscriptions/subscriptions/search")
 
         assert response.status_code == 401
@@ -1182,8 +1068,8 @@ class TestSearchSubscriptions:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get("/api/v1/subscriptions/subscriptions/search")
@@ -1219,8 +1105,8 @@ class TestSearchSubscriptions:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get("/api/v1/subscriptions/subscriptions/search")
@@ -1259,8 +1145,8 @@ class TestSearchSubscriptions:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get(
@@ -1301,8 +1187,8 @@ class TestSearchSubscriptions:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get(
@@ -1338,8 +1224,8 @@ class TestSearchSubscriptions:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get(
@@ -1381,17 +1267,10 @@ class TestCreateFreeSubscription:
 
 @pytest.mark.asyncio
 class TestUpgradeSubscription:
-    async def test_anonymous(
-        self,
-        client: AsyncClient,
-        subscription: Subscription,
-        subscription_tier_organization_second: SubscriptionTier,
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/subscriptions/{subscription.id}",
-            json={
-                "subscription_tier_id": str(subscription_tier_organization_second.id)
-            },
+            f"/api/v1/subscriptions/subscriptions/{_MISSING_UUID}",
+            json={"subscription_tier_id": str(_MISSING_UUID)},
         )
 
         assert response.status_code == 401
@@ -1403,7 +1282,7 @@ class TestUpgradeSubscription:
         subscription_tier_organization_second: SubscriptionTier,
     ) -> None:
         response = await client.post(
-            f"/api/v1/subscriptions/subscriptions/{uuid.uuid4()}",
+            f"/api/v1/subscriptions/subscriptions/{_MISSING_UUID}",
             json={
                 "subscription_tier_id": str(subscription_tier_organization_second.id)
             },
@@ -1433,11 +1312,9 @@ class TestUpgradeSubscription:
 
 @pytest.mark.asyncio
 class TestCancelSubscription:
-    async def test_anonymous(
-        self, client: AsyncClient, subscription: Subscription
-    ) -> None:
+    async def test_anonymous(self, client: AsyncClient) -> None:
         response = await client.delete(
-            f"/api/v1/subscriptions/subscriptions/{subscription.id}"
+            f"/api/v1/subscriptions/subscriptions/{_MISSING_UUID}"
         )
 
         assert response.status_code == 401
@@ -1445,18 +1322,25 @@ class TestCancelSubscription:
     @pytest.mark.authenticated
     async def test_not_existing(self, client: AsyncClient) -> None:
         response = await client.delete(
-            f"/api/v1/subscriptions/subscriptions/{uuid.uuid4()}"
+            f"/api/v1/subscriptions/subscriptions/{_MISSING_UUID}"
         )
 
         assert response.status_code == 404
 
     @pytest.mark.authenticated
     async def test_valid(
-        self, session: AsyncSession, client: AsyncClient, subscription: Subscription
+        self,
+        session: AsyncSession,
+        client: AsyncClient,
+        subscription_tier_organization: SubscriptionTier,
+        user: User,
     ) -> None:
-        subscription.status = SubscriptionStatus.active
-        session.add(subscription)
-        await session.commit()
+        subscription = await create_subscription(
+            session,
+            subscription_tier=subscription_tier_organization,
+            user=user,
+            status=SubscriptionStatus.active,
+        )
 
         response = await client.delete(
             f"/api/v1/subscriptions/subscriptions/{subscription.id}"
@@ -1467,6 +1351,32 @@ class TestCancelSubscription:
         json = response.json()
         assert json["id"] == str(subscription.id)
 
+    @pytest.mark.authenticated
+    async def test_valid_github_user(
+        self,
+        session: AsyncSession,
+        client: AsyncClient,
+        subscription_tier_organization: SubscriptionTier,
+        user: User,
+        user_github_oauth: OAuthAccount,  # add github account to user
+    ) -> None:
+        subscription = await create_subscription(
+            session,
+            subscription_tier=subscription_tier_organization,
+            user=user,
+            status=SubscriptionStatus.active,
+        )
+
+        response = await client.delete(
+            f"/api/v1/subscriptions/subscriptions/{subscription.id}"
+        )
+
+        assert response.status_code == 200
+
+        json = response.json()
+        assert json["user"]["name"] == user.username
+        assert json["user"]["github_username"] == user.username
+
 
 @pytest.mark.asyncio
 class TestSearchSubscriptionsSummary:
@@ -1504,8 +1414,8 @@ class TestSearchSubscriptionsSummary:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get(
@@ -1549,8 +1459,8 @@ class TestSearchSubscriptionsSummary:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get(
@@ -1596,8 +1506,8 @@ class TestSearchSubscriptionsSummary:
             session,
             subscription_tier=subscription_tier_organization,
             user=user,
-            started_at=datetime(2023, 1, 1),
-            ended_at=datetime(2023, 6, 15),
+            started_at=_STARTED_AT,
+            ended_at=_ENDED_AT,
         )
 
         response = await client.get(
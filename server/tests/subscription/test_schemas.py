@@ -0,0 +1,131 @@
+import uuid
+from typing import Any
+
+import pytest
+from pydantic import ValidationError, parse_obj_as
+
+from polar.models import SubscriptionBenefit, SubscriptionTier
+from polar.postgres import AsyncSession
+from polar.subscription.schemas import (
+    SubscriptionBenefitCreate,
+    SubscriptionBenefitCustomCreate,
+    SubscriptionBenefitUpdate,
+    SubscriptionTierCreate,
+    SubscriptionTierUpdate,
+)
+from polar.subscription.schemas import SubscriptionTier as SubscriptionTierSchema
+
+from .conftest import set_subscription_benefits
+
+TOO_LONG_DESCRIPTION = (
+    "This is a way too long description that shall never fit "
+    "in the space we have in a single subscription tier card. "
+    "That's why we need to add this upper limit of characters, "
+    "otherwise users would put loads and loads of text that would "
+    "result in a very ugly output on the subscription page."
+)
+
+TIER_INVALID_PAYLOADS: list[dict[str, Any]] = [
+    {"name": "This is a way too long name for a subscription tier"},
+    {"name": "ab"},
+    {"name": ""},
+    {"description": TOO_LONG_DESCRIPTION},
+    {"price_currency": "EUR"},
+]
+
+
+class TestSubscriptionTierCreate:
+    @pytest.mark.parametrize(
+        "payload", [*TIER_INVALID_PAYLOADS, {"price_currency": "USDX"}]
+    )
+    def test_validation(self, payload: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            SubscriptionTierCreate(
+                **{
+                    "type": "hobby",
+                    "name": "Subscription Tier",
+                    "price_amount": 1000,
+                    "organization_id": uuid.uuid4(),
+                    **payload,
+                }
+            )
+
+
+class TestSubscriptionTierUpdate:
+    @pytest.mark.parametrize("payload", TIER_INVALID_PAYLOADS)
+    def test_validation(self, payload: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            SubscriptionTierUpdate(**payload)
+
+
+@pytest.mark.asyncio
+class TestSubscriptionTier:
+    async def test_from_db(
+        self,
+        session: AsyncSession,
+        subscription_tier_organization: SubscriptionTier,
+        subscription_benefit_organization: SubscriptionBenefit,
+    ) -> None:
+        subscription_tier = await set_subscription_benefits(
+            session,
+            subscription_tier=subscription_tier_organization,
+            subscription_benefits=[subscription_benefit_organization],
+        )
+
+        assert SubscriptionTierSchema.from_db(
+            subscription_tier
+        ) == SubscriptionTierSchema.from_orm(subscription_tier)
+
+
+class TestSubscriptionBenefitCreate:
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {
+                "is_tax_applicable": True,
+                "properties": {},
+                "description": TOO_LONG_DESCRIPTION,
+            },
+            {
+                "is_tax_applicable": True,
+                "properties": {},
+                "description": "Th",
+            },
+            {"description": "Subscription Benefit", "properties": {}},
+            {
+                "type": "articles",
+                "description": "My articles benefit",
+                "properties": {"paid_articles": True},
+            },
+        ],
+    )
+    def test_validation(self, payload: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            parse_obj_as(
+                SubscriptionBenefitCreate,  # type: ignore[arg-type]
+                {"type": "custom", "organization_id": str(uuid.uuid4()), **payload},
+            )
+
+    def test_custom(self) -> None:
+        subscription_benefit: SubscriptionBenefitCreate = parse_obj_as(
+            SubscriptionBenefitCreate,  # type: ignore[arg-type]
+            {
+                "type": "custom",
+                "description": "Subscription Benefit",
+                "is_tax_applicable": True,
+                "properties": {},
+                "organization_id": str(uuid.uuid4()),
+            },
+        )
+
+        assert type(subscription_benefit) is SubscriptionBenefitCustomCreate
+
+
+class TestSubscriptionBenefitUpdate:
+    @pytest.mark.parametrize(
+        "payload",
+        [{"type": "custom", "description": TOO_LONG_DESCRIPTION}],
+    )
+    def test_validation(self, payload: dict[str, Any]) -> None:
+        with pytest.raises(ValidationError):
+            parse_obj_as(SubscriptionBenefitUpdate, payload)  # type: ignore[arg-type]
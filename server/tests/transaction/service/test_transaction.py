@@ -8,8 +8,11 @@ from polar.kit.pagination import PaginationParams
 from polar.models import Account, Organization, Transaction, User, UserOrganization
 from polar.models.transaction import TransactionType
 from polar.postgres import AsyncSession
+from polar.transaction.service.transaction import SearchSortProperty
 from polar.transaction.service.transaction import transaction as transaction_service
 
+from ..conftest import create_transaction
+
 
 @pytest.fixture
 def authz(session: AsyncSession) -> Authz:
@@ -33,6 +36,27 @@ class TestSearch:
         assert count == 0
         assert len(results) == 0
 
+    async def test_no_memberships(
+        self,
+        session: AsyncSession,
+        user: User,
+        user_transactions: list[Transaction],
+        all_transactions: list[Transaction],
+    ) -> None:
+        session.expunge_all()
+
+        results, count = await transaction_service.search(
+            session, user, pagination=PaginationParams(1, 10)
+        )
+
+        assert count == len(user_transactions)
+        assert len(results) == len(user_transactions)
+
+        user_transactions_id = [t.id for t in user_transactions]
+
+        for result in results:
+            assert result.id in user_transactions_id
+
     async def test_no_filter(
         self,
         session: AsyncSession,
@@ -162,6 +186,43 @@ class TestSearch:
         for result in results:
             assert result.id in organization_transactions_id
 
+    async def test_default_sorting(self, session: AsyncSession, user: User) -> None:
+        transactions = [
+            await create_transaction(
+                session, type=TransactionType.payment, payment_user=user
+            )
+            for _ in range(3)
+        ]
+        session.expunge_all()
+
+        results, count = await transaction_service.search(
+            session, user, pagination=PaginationParams(1, 10)
+        )
+
+        assert count == len(transactions)
+        assert [result.id for result in results] == [
+            t.id for t in reversed(transactions)
+        ]
+
+    async def test_sorting_amount(self, session: AsyncSession, user: User) -> None:
+        transactions = [
+            await create_transaction(
+                session, type=TransactionType.payment, payment_user=user, amount=amount
+            )
+            for amount in (3000, 1000, 2000)
+        ]
+        session.expunge_all()
+
+        results, count = await transaction_service.search(
+            session,
+            user,
+            pagination=PaginationParams(1, 10),
+            sorting=[(SearchSortProperty.amount, False)],
+        )
+
+        assert count == len(transactions)
+        assert [result.amount for result in results] == [1000, 2000, 3000]
+
 
 @pytest.mark.asyncio
 class TestGetSummary: